@@ -16,6 +16,13 @@ __author__ = "Priya Nagar"
 __version__ = "1.0.0"
 
 
+import functools
+import heapq
+import itertools
+import operator
+from array import array
+from collections import defaultdict
+
 import networkx as nx
 
 # just an eample for the structure of the schedule to be returned and to check the frontend and backend connection
@@ -51,15 +58,175 @@ example_schedule = [
 ]
 
 
+@functools.lru_cache(maxsize=8)
+def _build_dag(num_tasks, edges, reverse=False):
+    """
+    Build the adjacency and in-degrees of a dependency graph over job indices.
+
+    The schedulers are run one after the other on the same application, so the result is cached on the edges.
+    It is shared between calls and must not be modified; copy the in-degrees before counting them down.
+
+    Args:
+        num_tasks (int): Number of jobs, which are numbered ``0..num_tasks-1``.
+        edges (tuple of tuple): ``(sender, receiver)`` index pair of each message.
+        reverse (bool): Point the edges from receiver to sender instead.
+
+    Returns:
+        tuple: The successors in compressed sparse row form, as an ``indptr`` and an ``indices`` ``array('i')``
+               where the successors of job ``i`` are ``indices[indptr[i]:indptr[i + 1]]``, and the number of
+               predecessors of each job as an ``array('i')``.
+    """
+    if reverse:
+        edges = [(receiver, sender) for sender, receiver in edges]
+
+    # Count the successors of each job, turn the counts into row offsets,
+    # then drop every edge into the next free slot of its row
+    indptr = array("i", [0]) * (num_tasks + 1)
+    in_degree = array("i", [0]) * num_tasks
+    for sender, receiver in edges:
+        indptr[sender + 1] += 1
+        in_degree[receiver] += 1
+    indptr = array("i", itertools.accumulate(indptr))
+    cursor = indptr[:-1]
+    indices = array("i", [0]) * len(edges)
+    for sender, receiver in edges:
+        indices[cursor[sender]] = receiver
+        cursor[sender] += 1
+    return indptr, indices, in_degree
+
+
+def _indexed_dag(tasks, messages, reverse=False):
+    """
+    Build the dependency graph of the jobs over their positions in ``tasks``.
+
+    Args:
+        tasks (list of dict): Jobs of the application.
+        messages (list of dict): Messages between the jobs, each sender being a predecessor of its receiver.
+        reverse (bool): Point the edges from receiver to sender instead.
+
+    Raises:
+        ValueError: If a message refers to a task that is not in ``tasks``.
+
+    Returns:
+        tuple: The ``indptr`` and ``indices`` of the successors as returned by :func:`_build_dag`, and a private
+               copy of the in-degrees that may be counted down.
+    """
+    index_of = {task["id"]: index for index, task in enumerate(tasks)}
+    try:
+        edges = tuple(
+            (index_of[message["sender"]], index_of[message["receiver"]])
+            for message in messages
+        )
+    except KeyError as err:
+        raise ValueError(f"Message refers to unknown task {err.args[0]}") from None
+    indptr, indices, in_degree = _build_dag(len(tasks), edges, reverse)
+    return indptr, indices, in_degree[:]
+
+
+def _topological_order(tasks, messages, priority_key, reverse=False):
+    """
+    Order the jobs so that every job comes after all of its predecessors.
+
+    This is Kahn's algorithm where the ready job with the smallest key is taken next from a binary heap, in
+    O((V+E) log V). With ``reverse`` the graph is walked from tail to head, a job becoming ready once all of its
+    successors are taken, and the resulting order is flipped at the end as required by LDF.
+
+    Args:
+        tasks (list of dict): Jobs of the application.
+        messages (list of dict): Messages between the jobs, each sender being a predecessor of its receiver.
+        priority_key (callable): Maps a job to the key it is ordered by among the ready jobs.
+        reverse (bool): Select jobs from tail to head instead of head to tail.
+
+    Raises:
+        networkx.NetworkXUnfeasible: If the messages contain a cyclic dependency.
+        ValueError: If a message refers to an unknown task.
+
+    Returns:
+        list of dict: The jobs in topological order.
+    """
+    # The traversal runs over the dense indices 0..N-1 of the jobs instead of
+    # their ids, and only maps back to the job dicts at the end
+    num_tasks = len(tasks)
+    indptr, indices, in_degree = _indexed_dag(tasks, messages, reverse)
+
+    # Ties between equal keys go to the job listed first
+    keys = [priority_key(task) for task in tasks]
+    ready = [(keys[index], index) for index in range(num_tasks) if not in_degree[index]]
+    heapq.heapify(ready)
+
+    order = []
+    while ready:
+        _, index = heapq.heappop(ready)
+        order.append(index)
+        for dependent in indices[indptr[index] : indptr[index + 1]]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                heapq.heappush(ready, (keys[dependent], dependent))
+
+    if len(order) < num_tasks:
+        raise nx.NetworkXUnfeasible("Messages contain a cyclic dependency")
+
+    if reverse:
+        order.reverse()
+    return [tasks[index] for index in order]
+
+
+def _negated_deadline(task):
+    """Order jobs by descending deadline, as LDF selects them from tail to head."""
+    return -task["deadline"]
+
+
+def _schedule_single(application_data, reverse):
+    """
+    Schedule jobs back to back on a single node in deadline order.
+
+    EDF repeatedly takes the job with the earliest deadline among those whose predecessors are all scheduled. LDF
+    builds the order from tail to head instead, placing last the job with the latest deadline among those whose
+    successors are all placed.
+
+    Args:
+        application_data (dict): Job data including dependencies represented by messages between jobs.
+        reverse (bool): Build the LDF order instead of the EDF one.
+
+    Returns:
+        list of dict: The scheduled job details, each entry detailing the node assigned, start and end times,
+                      and the job's deadline.
+    """
+    tasks = application_data["tasks"]
+    messages = application_data["messages"]
+    if messages:
+        order = _topological_order(
+            tasks,
+            messages,
+            priority_key=_negated_deadline if reverse else operator.itemgetter("deadline"),
+            reverse=reverse,
+        )
+    else:
+        # Without dependencies the traversal reduces to a plain sort
+        order = sorted(tasks, key=operator.itemgetter("deadline"), reverse=reverse)
+        if reverse:
+            order.reverse()
+
+    # Jobs run back to back, so the end times are the running sum of the wcets
+    end_times = itertools.accumulate(task["wcet"] for task in order)
+    return [
+        {
+            "task_id": task["id"],
+            "node_id": 0,
+            "start_time": end_time - task["wcet"],
+            "end_time": end_time,
+            "deadline": task["deadline"],
+        }
+        for task, end_time in zip(order, end_times)
+    ]
+
+
 def ldf_single_node(application_data):
     """
     Schedule jobs on a single node using the Latest Deadline First (LDF) strategy.
 
     This function schedules jobs based on their latest deadlines after sorting them and considering dependencies through a directed graph representation.
 
-    .. todo:: Implement Latest Dealine First Scheduling (LDF) algorithm for single compute node.
-
-
     Args:
         application_data (dict): Contains jobs and messages that indicate dependencies among jobs.
 
@@ -67,8 +234,10 @@ def ldf_single_node(application_data):
         list of dict: Scheduling results with each job's details, including execution time, node assignment,
                       and start/end times relative to other jobs.
     """
-
-    return {"schedule": example_schedule, "name": "LDF Single Node"}
+    return {
+        "schedule": _schedule_single(application_data, reverse=True),
+        "name": "LDF Single Node",
+    }
 
 
 def edf_single_node(application_data):
@@ -79,8 +248,6 @@ def edf_single_node(application_data):
     deadlines. It builds a dependency graph and schedules accordingly, ensuring that jobs with no predecessors are
     scheduled first, and subsequent jobs are scheduled based on the minimum deadline of available nodes.
 
-    .. todo:: Implement Earliest Deadline First Scheduling (EDF) algorithm for single compute node.
-
     Args:
         application_data (dict): Job data including dependencies represented by messages between jobs.
 
@@ -88,62 +255,360 @@ def edf_single_node(application_data):
         list of dict: Contains the scheduled job details, each entry detailing the node assigned, start and end times,
                       and the job's deadline.
     """
-
-    return {"schedule": example_schedule, "name": "EDF Single Node"}
+    return {
+        "schedule": _schedule_single(application_data, reverse=False),
+        "name": "EDF Single Node",
+    }
 
 
-def ll_multinode(application_data, platform_data):
+def ll_multinode(application_data, platform_data, use_link_delay=False):
     """
     Schedule jobs on a distributed system with multiple compute nodes using the Least Laxity (LL) strategy.
     This function schedules jobs based on their laxity, with the job having the least laxity being scheduled first.
 
-    .. todo:: Implement Least Laxity (LL) algorithm to schedule jobs on multiple node in a distributed system.
+    At every dispatch the laxity ``deadline - start_time - wcet`` of each ready job is computed from the earliest
+    time it could start, given the free nodes and when its predecessors end, and the job with the least laxity is
+    placed there.
+
+    With instantaneous communication a ready job starts at the later of the time the first compute node becomes
+    free and the time its last predecessor ends, its release time. The jobs already released then share that start
+    and are ordered by ``deadline - wcet`` alone, while the others are ordered by ``deadline - wcet - release``, so
+    both are kept on binary heaps and a job moves from the second to the first once the nodes catch up with its
+    release. Only with ``use_link_delay``, where the start also depends on the node, is every ready job evaluated
+    at each dispatch.
 
     Args:
         application_data (dict): Job data including dependencies represented by messages between jobs.
+        platform_data (dict): Contains information about the platform, nodes and their types, the links between the nodes and the associated link delay.
+        use_link_delay (bool): Delay each message by the accumulated link delay of its route instead of assuming
+                               instantaneous communication.
+
+    Raises:
+        ValueError: If the platform has no compute node or a message refers to an unknown task.
 
     Returns:
         list of dict: Contains the scheduled job details, each entry detailing the node assigned, start and end times,
                       and the job's deadline.
 
     """
-    return {"schedule": example_schedule, "name": "LL Multi Node"}
-
-
-def ldf_multinode(application_data, platform_data):
+    tasks = application_data["tasks"]
+    messages = application_data["messages"]
+    earliest_start, place, earliest_free = _node_dispatcher(
+        messages, platform_data, use_link_delay
+    )
+    num_tasks = len(tasks)
+    indptr, indices, in_degree = _indexed_dag(tasks, messages)
+    slack = [task["deadline"] - task["wcet"] for task in tasks]
+    release = [0] * num_tasks
+
+    # Ties between equal laxities go to the job listed first
+    if use_link_delay:
+        ready = []
+        push = ready.append
+
+        def pop():
+            index = min(
+                ready,
+                key=lambda index: (slack[index] - earliest_start(tasks[index])[0], index),
+            )
+            ready.remove(index)
+            return index
+
+    else:
+        released = []  # (slack, index)
+        waiting = []  # (release, index)
+        waiting_laxity = []  # (slack - release, index)
+        # Jobs taken from waiting_laxity stay behind in waiting and the other
+        # way round; both are skipped lazily once the job is no longer waiting
+        is_waiting = [False] * num_tasks
+
+        def push(index):
+            if release[index] <= earliest_free():
+                heapq.heappush(released, (slack[index], index))
+            else:
+                is_waiting[index] = True
+                heapq.heappush(waiting, (release[index], index))
+                heapq.heappush(waiting_laxity, (slack[index] - release[index], index))
+
+        def pop():
+            now = earliest_free()
+            while waiting and waiting[0][0] <= now:
+                _, index = heapq.heappop(waiting)
+                if is_waiting[index]:
+                    is_waiting[index] = False
+                    heapq.heappush(released, (slack[index], index))
+            while waiting_laxity and not is_waiting[waiting_laxity[0][1]]:
+                heapq.heappop(waiting_laxity)
+
+            if waiting_laxity and (
+                not released or waiting_laxity[0] < (released[0][0] - now, released[0][1])
+            ):
+                _, index = heapq.heappop(waiting_laxity)
+                is_waiting[index] = False
+            else:
+                _, index = heapq.heappop(released)
+            return index
+
+    num_ready = 0
+    for index in range(num_tasks):
+        if not in_degree[index]:
+            push(index)
+            num_ready += 1
+
+    ll_schedule = []
+    while num_ready:
+        index = pop()
+        num_ready -= 1
+        task = tasks[index]
+        entry = place(task, *earliest_start(task))
+        ll_schedule.append(entry)
+
+        for dependent in indices[indptr[index] : indptr[index + 1]]:
+            release[dependent] = max(release[dependent], entry["end_time"])
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                push(dependent)
+                num_ready += 1
+
+    if len(ll_schedule) < num_tasks:
+        raise nx.NetworkXUnfeasible("Messages contain a cyclic dependency")
+
+    return {"schedule": ll_schedule, "name": "LL Multi Node"}
+
+
+def ldf_multinode(application_data, platform_data, use_link_delay=False):
     """
     Schedule jobs on a distributed system with multiple compute nodes using the Latest Deadline First(LDF) strategy.
-    This function schedules jobs based on their periods and deadlines, with the shortest period job being scheduled first.
+    This function schedules jobs based on their deadlines, with the latest deadline job being scheduled last.
 
-    .. todo:: Implement Latest Deadline First(LDF) algorithm to schedule jobs on multiple nodes in a distributed system.
+    The job order is built from tail to head as in :func:`ldf_single_node` and then dispatched to the compute nodes.
 
     Args:
         application_data (dict): Job data including dependencies represented by messages between jobs.
         platform_data (dict): Contains information about the platform, nodes and their types, the links between the nodes and the associated link delay.
+        use_link_delay (bool): Delay each message by the accumulated link delay of its route instead of assuming
+                               instantaneous communication.
+
+    Raises:
+        ValueError: If the platform has no compute node or a message refers to an unknown task.
 
     Returns:
         list of dict: Contains the scheduled job details, each entry detailing the node assigned, start and end times,
                       and the job's deadline.
 
     """
-    return {"schedule": example_schedule, "name": "LDF Multi Node"}
+    order = _topological_order(
+        application_data["tasks"],
+        application_data["messages"],
+        priority_key=_negated_deadline,
+        reverse=True,
+    )
+    return {
+        "schedule": _assign_to_nodes(
+            order, application_data["messages"], platform_data, use_link_delay
+        ),
+        "name": "LDF Multi Node",
+    }
+
+
+def _build_network(links):
+    """Build the undirected platform graph weighted by link delay."""
+    network = nx.Graph()
+    network.add_weighted_edges_from(
+        ((link["start_node"], link["end_node"], link["link_delay"]) for link in links),
+        weight="link_delay",
+    )
+    return network
+
+
+def _compute_nodes(platform_data):
+    """
+    Collect the ids of the compute nodes of the platform, the only nodes that can run jobs.
+
+    Args:
+        platform_data (dict): Contains information about the platform, nodes and their types.
+
+    Raises:
+        ValueError: If the platform has no compute node.
+
+    Returns:
+        list of int: Ids of the compute nodes.
+    """
+    nodes = [node["id"] for node in platform_data["nodes"] if node["type"] == "compute"]
+    if not nodes:
+        raise ValueError("Platform has no compute node")
+    return nodes
+
+
+def _node_dispatcher(messages, platform_data, use_link_delay=False):
+    """
+    Track the compute nodes of the platform while jobs are dispatched to them one at a time.
+
+    A job goes to either the compute node that becomes free first or one of its predecessors' nodes, whichever
+    lets it start earliest. It starts once its node is free and all of its predecessors have ended. With
+    ``use_link_delay`` it also waits for their messages to arrive over the links; otherwise communication is
+    instantaneous, as assumed by the task sheet.
+
+    Args:
+        messages (list of dict): Messages between the jobs, each sender being a predecessor of its receiver.
+        platform_data (dict): Contains information about the platform, nodes and their types, the links between the nodes and the associated link delay.
+        use_link_delay (bool): Delay each message between two nodes by the accumulated link delay of the route
+                               between them, if the links connect them at all.
+
+    Raises:
+        ValueError: If the platform has no compute node.
+
+    Returns:
+        tuple: ``earliest_start(task)``, giving the ``(start_time, node_id)`` a job whose predecessors are all
+               placed would get, ``place(task, start_time, node_id)``, which books the node and returns the
+               job's schedule entry, and ``earliest_free()``, giving the time the first compute node becomes free.
+    """
+    predecessors = defaultdict(list)
+    for message in messages:
+        predecessors[message["receiver"]].append(message["sender"])
+    predecessors = dict(predecessors)
+
+    if use_link_delay:
+        network = _build_network(platform_data["links"])
+        # source node -> {target node: accumulated link delay}, filled on first use
+        link_delay_map = {}
+
+    # Min-heap of (free_time, node_id, version) over the compute nodes, so
+    # that ties go to the lowest node id. A node's entry goes stale when its
+    # free time moves, which is detected lazily through its version when
+    # the entry reaches the top.
+    nodes = _compute_nodes(platform_data)
+    node_free = dict.fromkeys(nodes, 0)
+    version = dict.fromkeys(nodes, 0)
+    node_heap = [(0, node_id, 0) for node_id in nodes]
+    heapq.heapify(node_heap)
+
+    placement = {}
+
+    def earliest_free():
+        while node_heap[0][2] != version[node_heap[0][1]]:
+            heapq.heappop(node_heap)
+        return node_heap[0][0]
+
+    def earliest_start(task):
+        task_predecessors = predecessors.get(task["id"], ())
+        earliest_free()
+
+        # Either the earliest free node, or a predecessor's node which
+        # saves the link delay of that predecessor's message when enabled
+        candidates = {node_heap[0][1]}
+        candidates.update(placement[p][0] for p in task_predecessors)
+        best = None
+        for candidate in candidates:
+            start_time = node_free[candidate]
+            for predecessor in task_predecessors:
+                pred_node, pred_end = placement[predecessor]
+                if use_link_delay and candidate != pred_node:
+                    delays = link_delay_map.get(pred_node)
+                    if delays is None:
+                        delays = link_delay_map[pred_node] = (
+                            nx.single_source_dijkstra_path_length(
+                                network, pred_node, weight="link_delay"
+                            )
+                            if pred_node in network
+                            else {}
+                        )
+                    # Nodes that no route connects communicate instantaneously
+                    pred_end += delays.get(candidate, 0)
+                start_time = max(start_time, pred_end)
+            if best is None or (start_time, candidate) < best:
+                best = (start_time, candidate)
+        return best
+
+    def place(task, start_time, node_id):
+        end_time = start_time + task["wcet"]
+        node_free[node_id] = end_time
+        version[node_id] += 1
+        heapq.heappush(node_heap, (end_time, node_id, version[node_id]))
+        placement[task["id"]] = (node_id, end_time)
+        return {
+            "task_id": task["id"],
+            "node_id": node_id,
+            "start_time": start_time,
+            "end_time": end_time,
+            "deadline": task["deadline"],
+        }
+
+    return earliest_start, place, earliest_free
+
+
+def _assign_to_nodes(order, messages, platform_data, use_link_delay=False):
+    """
+    Dispatch jobs, in the given order, to the compute nodes of the platform as described in
+    :func:`_node_dispatcher`.
+
+    Args:
+        order (list of dict): Jobs in a topological order, in which they are dispatched.
+        messages (list of dict): Messages between the jobs, each sender being a predecessor of its receiver.
+        platform_data (dict): Contains information about the platform, nodes and their types, the links between the nodes and the associated link delay.
+        use_link_delay (bool): Delay each message between two nodes by the accumulated link delay of the route
+                               between them, if the links connect them at all.
+
+    Returns:
+        list of dict: The scheduled job details, each entry detailing the node assigned, start and end times,
+                      and the job's deadline.
+    """
+    earliest_start, place, _ = _node_dispatcher(messages, platform_data, use_link_delay)
+    return [place(task, *earliest_start(task)) for task in order]
 
 
-def edf_multinode(application_data, platform_data):
+def edf_multinode(application_data, platform_data, use_link_delay=False):
     """
     Schedule jobs on a distributed system with multiple compute nodes using the Earliest Deadline First (EDF) strategy.
     This function processes application data to schedule jobs based on the earliest
     deadlines.
 
-    .. todo:: Implement Earliest Deadline First(EDF) algorithm to schedule jobs on multiple nodes in a distributed system.
+    Among the jobs whose predecessors are all scheduled, the one with the earliest deadline is dispatched next.
 
     Args:
         application_data (dict): Job data including dependencies represented by messages between jobs.
         platform_data (dict): Contains information about the platform, nodes and their types, the links between the nodes and the associated link delay.
+        use_link_delay (bool): Delay each message by the accumulated link delay of its route instead of assuming
+                               instantaneous communication.
+
+    Raises:
+        ValueError: If the platform has no compute node or a message refers to an unknown task.
 
     Returns:
         list of dict: Contains the scheduled job details, each entry detailing the node assigned, start and end times,
                       and the job's deadline.
 
     """
-    return {"schedule": example_schedule, "name": "EDF Multi Node"}
+    tasks = application_data["tasks"]
+    messages = application_data["messages"]
+    if messages:
+        order = _topological_order(
+            tasks, messages, priority_key=operator.itemgetter("deadline")
+        )
+        return {
+            "schedule": _assign_to_nodes(
+                order, messages, platform_data, use_link_delay
+            ),
+            "name": "EDF Multi Node",
+        }
+
+    # Without dependencies no messages are sent, so each job in deadline
+    # order simply goes to the compute node that becomes free first
+    node_heap = [(0, node_id) for node_id in _compute_nodes(platform_data)]
+    heapq.heapify(node_heap)
+    edf_schedule = []
+    for task in sorted(tasks, key=operator.itemgetter("deadline")):
+        start_time, node_id = node_heap[0]
+        end_time = start_time + task["wcet"]
+        heapq.heapreplace(node_heap, (end_time, node_id))
+        edf_schedule.append(
+            {
+                "task_id": task["id"],
+                "node_id": node_id,
+                "start_time": start_time,
+                "end_time": end_time,
+                "deadline": task["deadline"],
+            }
+        )
+
+    return {"schedule": edf_schedule, "name": "EDF Multi Node"}
@@ -22,6 +22,7 @@ import uvicorn
 import json
 import jsonschema
 from jsonschema import validate
+import networkx as nx
 import os
 
 from config import SERVER_PORT, SERVER_HOST
@@ -69,7 +70,9 @@ def schedule_jobs(data: dict):
         data (dict): A dictionary containing 'application' and 'platform' data necessary for scheduling.
 
     Raises:
-        HTTPException: If the 'application' or 'platform' data is missing or malformed, a 400 error is raised.
+        HTTPException: If the 'application' or 'platform' data is missing or malformed, the job dependencies
+                       are cyclic or refer to unknown jobs, or the platform has no compute node, a 400 error is
+                       raised.
 
     Returns:
         dict: A dictionary containing schedules calculated using different algorithms:
@@ -92,11 +95,18 @@ def schedule_jobs(data: dict):
     application_data = data.get("application")
     platform_data = data.get("platform")
 
-    ldf_single_node = alg.ldf_single_node(application_data)
-    edf_single_node = alg.edf_single_node(application_data)
-    ll_multinode = alg.ll_multinode(application_data, platform_data)
-    ldf_multinode = alg.ldf_multinode(application_data, platform_data)
-    edf_multinode = alg.edf_multinode(application_data, platform_data)
+    try:
+        ldf_single_node = alg.ldf_single_node(application_data)
+        edf_single_node = alg.edf_single_node(application_data)
+        ll_multinode = alg.ll_multinode(application_data, platform_data)
+        ldf_multinode = alg.ldf_multinode(application_data, platform_data)
+        edf_multinode = alg.edf_multinode(application_data, platform_data)
+    except nx.NetworkXUnfeasible as err:
+        print("Input data is invalid:", err)
+        raise HTTPException(400, "Cyclic job dependencies")
+    except ValueError as err:
+        print("Input data is invalid:", err)
+        raise HTTPException(400, str(err))
 
     response = {
         "schedule1": ldf_single_node,
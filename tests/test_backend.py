@@ -0,0 +1,58 @@
+import os
+import sys
+
+from fastapi.testclient import TestClient
+
+# Adjust path to include the 'src' directory for importing the backend
+script_dir = os.path.dirname(__file__)
+sys.path.append(os.path.abspath(os.path.join(script_dir, "..", "src")))
+from backend import app
+
+client = TestClient(app)
+
+
+def test_schedule_jobs_rejects_cyclic_dependencies():
+    """Test that scheduling cyclic task dependencies is answered with a 400."""
+    data = {
+        "application": {
+            "tasks": [
+                {"id": 0, "wcet": 1, "mcet": 1, "deadline": 5},
+                {"id": 1, "wcet": 1, "mcet": 1, "deadline": 5},
+            ],
+            "messages": [
+                {"id": 0, "sender": 0, "receiver": 1, "size": 1},
+                {"id": 1, "sender": 1, "receiver": 0, "size": 1},
+            ],
+        },
+        "platform": {"nodes": [{"id": 0, "type": "compute"}], "links": []},
+    }
+    response = client.post("/schedule_jobs", json=data)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Cyclic job dependencies"
+
+
+def test_schedule_jobs_rejects_platform_without_compute_node():
+    """Test that a platform without compute nodes is answered with a 400."""
+    data = {
+        "application": {
+            "tasks": [{"id": 0, "wcet": 1, "mcet": 1, "deadline": 5}],
+            "messages": [],
+        },
+        "platform": {"nodes": [{"id": 0, "type": "router"}], "links": []},
+    }
+    response = client.post("/schedule_jobs", json=data)
+    assert response.status_code == 400
+
+
+def test_schedule_jobs_rejects_message_to_unknown_task():
+    """Test that a message referring to an unknown task is answered with a 400."""
+    data = {
+        "application": {
+            "tasks": [{"id": 0, "wcet": 1, "mcet": 1, "deadline": 5}],
+            "messages": [{"id": 0, "sender": 0, "receiver": 7, "size": 1}],
+        },
+        "platform": {"nodes": [{"id": 0, "type": "compute"}], "links": []},
+    }
+    response = client.post("/schedule_jobs", json=data)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Message refers to unknown task 7"
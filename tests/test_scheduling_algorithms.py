@@ -1,13 +1,23 @@
 import pytest
 import os
 import json
+import random
 import sys
 
+import networkx as nx
+
 # Adjust path to include the 'src' directory for importing algorithms
 script_dir = os.path.dirname(__file__)
 input_models_dir = os.path.join(script_dir, "input_models")
 sys.path.append(os.path.abspath(os.path.join(script_dir, "..", "src")))
-from algorithms import edf_multinode, ll_multinode, ldf_multinode
+from algorithms import (
+    edf_multinode,
+    ll_multinode,
+    ldf_multinode,
+    edf_single_node,
+    ldf_single_node,
+    _assign_to_nodes,
+)
 
 
 # Utility function to load models and run scheduling algorithm
@@ -72,3 +82,179 @@ def test_task_dependencies(filename):
             assert start_time >= max(
                 predecessors_end_times, default=0
             ), "Task starts before predecessor ends"
+
+
+@pytest.mark.parametrize("use_link_delay", [False, True])
+def test_single_compute_node_without_links(use_link_delay):
+    """Test that jobs run back to back on a platform with one compute node and no links."""
+    model_path = os.path.join(input_models_dir, "example3.json")
+    with open(model_path) as f:
+        application_model = json.load(f)["application"]
+    platform_model = {"nodes": [{"id": 0, "type": "compute"}], "links": []}
+
+    for algo in [edf_multinode, ll_multinode, ldf_multinode]:
+        schedule = algo(application_model, platform_model, use_link_delay)["schedule"]
+        assert [task["node_id"] for task in schedule] == [0] * 6
+        assert [task["start_time"] for task in schedule] == list(range(6))
+
+
+@pytest.mark.parametrize("algo", [edf_multinode, ll_multinode, ldf_multinode])
+def test_link_delay_between_compute_nodes(algo):
+    """Test that a message between two compute nodes is delayed by the links of its route."""
+    application_model = {
+        "tasks": [
+            {"id": 0, "wcet": 5, "mcet": 1, "deadline": 50},
+            {"id": 1, "wcet": 5, "mcet": 1, "deadline": 50},
+            {"id": 2, "wcet": 5, "mcet": 1, "deadline": 50},
+        ],
+        "messages": [
+            {"id": 0, "sender": 0, "receiver": 2, "size": 1},
+            {"id": 1, "sender": 1, "receiver": 2, "size": 1},
+        ],
+    }
+    # compute 0 -- router 2 -- compute 1
+    platform_model = {
+        "nodes": [
+            {"id": 0, "type": "compute"},
+            {"id": 1, "type": "compute"},
+            {"id": 2, "type": "router"},
+        ],
+        "links": [
+            {"id": 0, "start_node": 0, "end_node": 2, "link_delay": 3},
+            {"id": 1, "start_node": 2, "end_node": 1, "link_delay": 4},
+        ],
+    }
+
+    schedule = algo(application_model, platform_model, use_link_delay=True)["schedule"]
+    entries = {task["task_id"]: task for task in schedule}
+    assert {entries[0]["node_id"], entries[1]["node_id"]} == {0, 1}
+    # Whichever node task 2 runs on, one predecessor's message crosses both links
+    assert entries[2]["start_time"] == 5 + 3 + 4
+
+
+@pytest.mark.parametrize(
+    "algo, expected_order",
+    [(edf_single_node, [1, 3, 2, 4, 5, 6]), (ldf_single_node, [1, 2, 4, 3, 5, 6])],
+)
+def test_single_node_order(algo, expected_order):
+    """Test that the single-node schedulers produce the documented orders for example3."""
+    model_path = os.path.join(input_models_dir, "example3.json")
+    with open(model_path) as f:
+        application_model = json.load(f)["application"]
+
+    schedule = algo(application_model)["schedule"]
+    assert [task["task_id"] for task in schedule] == expected_order
+    assert [task["start_time"] for task in schedule] == list(range(6))
+
+
+def test_cyclic_dependencies():
+    """Test that cyclic dependencies between tasks are rejected."""
+    application_model = {
+        "tasks": [
+            {"id": 0, "wcet": 1, "mcet": 1, "deadline": 5},
+            {"id": 1, "wcet": 1, "mcet": 1, "deadline": 5},
+        ],
+        "messages": [
+            {"id": 0, "sender": 0, "receiver": 1, "size": 1},
+            {"id": 1, "sender": 1, "receiver": 0, "size": 1},
+        ],
+    }
+    with pytest.raises(nx.NetworkXUnfeasible):
+        edf_single_node(application_model)
+
+
+def test_independent_tasks_match_general_dispatch():
+    """Test that the schedule of independent tasks does not depend on the dispatch path taken."""
+    rng = random.Random(0)
+    for _ in range(50):
+        tasks = [
+            {"id": i, "wcet": rng.randint(1, 5), "mcet": 1, "deadline": rng.randint(1, 20)}
+            for i in range(rng.randint(1, 30))
+        ]
+        platform_model = {
+            "nodes": [{"id": i, "type": "compute"} for i in range(rng.randint(1, 5))],
+            "links": [],
+        }
+        schedule = edf_multinode({"tasks": tasks, "messages": []}, platform_model)
+        order = sorted(tasks, key=lambda t: t["deadline"])
+        general = _assign_to_nodes(order, [], platform_model)
+        assert schedule["schedule"] == general
+
+
+@pytest.mark.parametrize("filename", os.listdir(input_models_dir))
+def test_no_compute_node(filename):
+    """Test that a platform without compute nodes is rejected."""
+    model_path = os.path.join(input_models_dir, filename)
+    with open(model_path) as f:
+        application_model = json.load(f)["application"]
+    platform_model = {"nodes": [{"id": 0, "type": "router"}], "links": []}
+
+    for app in [application_model, dict(application_model, messages=[])]:
+        for algo in [edf_multinode, ll_multinode, ldf_multinode]:
+            with pytest.raises(ValueError):
+                algo(app, platform_model)
+
+
+def test_least_laxity_uses_earliest_start():
+    """Test that LL computes laxity from the earliest start time of each ready task."""
+    application_model = {
+        "tasks": [
+            {"id": 0, "wcet": 8, "mcet": 1, "deadline": 60},
+            {"id": 1, "wcet": 1, "mcet": 1, "deadline": 104},
+            {"id": 2, "wcet": 1, "mcet": 1, "deadline": 100},
+        ],
+        "messages": [{"id": 0, "sender": 0, "receiver": 1, "size": 1}],
+    }
+    platform_model = {
+        "nodes": [{"id": 0, "type": "compute"}, {"id": 1, "type": "compute"}],
+        "links": [],
+    }
+
+    # Task 1 can only start at 8, leaving it less laxity (95) than task 2 (99)
+    schedule = ll_multinode(application_model, platform_model)["schedule"]
+    assert [task["task_id"] for task in schedule] == [0, 1, 2]
+
+
+def test_message_to_unknown_task():
+    """Test that a message between tasks that do not exist is rejected."""
+    application_model = {
+        "tasks": [{"id": 0, "wcet": 1, "mcet": 1, "deadline": 5}],
+        "messages": [{"id": 0, "sender": 0, "receiver": 7, "size": 1}],
+    }
+    platform_model = {"nodes": [{"id": 0, "type": "compute"}], "links": []}
+
+    for algo in [edf_single_node, ldf_single_node]:
+        with pytest.raises(ValueError):
+            algo(application_model)
+    for algo in [edf_multinode, ll_multinode, ldf_multinode]:
+        with pytest.raises(ValueError):
+            algo(application_model, platform_model)
+
+
+def test_least_laxity_heaps_match_full_scan():
+    """Test that LL picks the same jobs from its heaps as from evaluating every ready task."""
+    rng = random.Random(0)
+    for _ in range(50):
+        num_tasks = rng.randint(1, 30)
+        tasks = [
+            {"id": i, "wcet": rng.randint(1, 5), "mcet": 1, "deadline": rng.randint(1, 60)}
+            for i in range(num_tasks)
+        ]
+        messages = [
+            {"id": i, "sender": sender, "receiver": receiver, "size": 1}
+            for i, (sender, receiver) in enumerate(
+                (rng.randrange(receiver), receiver)
+                for receiver in range(1, num_tasks)
+                for _ in range(rng.randint(0, 2))
+            )
+        ]
+        application_model = {"tasks": tasks, "messages": messages}
+        # Without links every message is instantaneous, but use_link_delay
+        # still evaluates the laxity of each ready task at every dispatch
+        platform_model = {
+            "nodes": [{"id": i, "type": "compute"} for i in range(rng.randint(1, 5))],
+            "links": [],
+        }
+        assert ll_multinode(application_model, platform_model) == ll_multinode(
+            application_model, platform_model, use_link_delay=True
+        )